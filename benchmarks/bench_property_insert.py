@@ -0,0 +1,91 @@
+"""Benchmark Property insert throughput: per-row ORM adds vs batched Core inserts.
+
+Usage: python benchmarks/bench_property_insert.py [--rows 50000] [--batch-size 5000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import uuid
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session as OrmSession
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from app import Property, db, insert_properties  # noqa: E402
+
+
+def make_records(n_rows):
+    """Build property rows shaped like the ones the upload pipeline produces"""
+    session_id = str(uuid.uuid4())
+    return [{
+        'session_id': session_id,
+        'address': f'{i} Main St',
+        'city': 'Austin',
+        'state': 'TX',
+        'zip_code': f'787{i % 100:02d}',
+        'listing_price': 250000.0 + i,
+        'living_square_feet': 1200 + i % 2000,
+        'condition_estimate': 'Medium',
+        'arv': 300000.0 + i,
+        'offer_price': 180000.0 + i,
+        'high_potential': i % 7 == 0,
+        'loi_file': f'{i}_Main_St_LOI.docx',
+        'loi_sent': False,
+        'follow_up_sent': False,
+        'comps_count': 250,
+        'avg_comp_price_sqft': 210.5,
+        'listing_agent_first_name': 'Ann',
+        'listing_agent_last_name': 'Lee',
+        'listing_agent_email': 'ann@example.com',
+        'listing_agent_phone': '555-0100'
+    } for i in range(n_rows)]
+
+
+def fresh_engine(directory, name):
+    engine = create_engine(f"sqlite:///{os.path.join(directory, name)}")
+    db.metadata.create_all(engine)
+    return engine
+
+
+def bench_orm_per_row(engine, records):
+    """The old upload path: one ORM object and session.add per row, default SQLite settings"""
+    with OrmSession(engine) as session:
+        session.execute(text('PRAGMA journal_mode=DELETE'))
+        session.execute(text('PRAGMA synchronous=FULL'))
+        start = time.perf_counter()
+        for record in records:
+            session.add(Property(**record))
+        session.commit()
+        return time.perf_counter() - start
+
+
+def bench_bulk_core(engine, records, batch_size):
+    """The new upload path: executemany Core inserts in batches on a tuned connection"""
+    with engine.begin() as connection:
+        start = time.perf_counter()
+        insert_properties(connection, records, batch_size)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=50000)
+    parser.add_argument('--batch-size', type=int, default=5000)
+    args = parser.parse_args()
+
+    records = make_records(args.rows)
+    with tempfile.TemporaryDirectory() as directory:
+        before = bench_orm_per_row(fresh_engine(directory, 'before.db'), records)
+        after = bench_bulk_core(fresh_engine(directory, 'after.db'), records, args.batch_size)
+
+    print(f"rows: {args.rows}")
+    print(f"before (ORM add per row):     {before:8.2f}s  {args.rows / before:10,.0f} rows/s")
+    print(f"after  (batched Core insert): {after:8.2f}s  {args.rows / after:10,.0f} rows/s")
+    print(f"speedup: {before / after:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,181 @@
+"""Benchmark the /upload pipeline stage by stage on synthetic data.
+
+Each (rows, format) case runs in a fresh interpreter so peak RSS is per case.
+Stages are timed separately: reading comps and properties, building the
+comps index (ARV), scoring, LOI rendering and the DB commit. Results are
+printed as a table and written as JSON so runs can be compared across commits.
+
+Usage: python benchmarks/bench_upload.py [--rows 1000 10000 100000 1000000] [--formats csv xlsx]
+                                         [--loi-rows 500] [--output results.json]
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.join(BENCH_DIR, '..')
+sys.path.insert(0, BENCH_DIR)
+
+from generate_data import dataset_paths  # noqa: E402
+
+STAGES = ['read_comps', 'calculate_arv', 'read_properties', 'score', 'generate_loi', 'db_commit']
+
+
+def peak_rss_mb(who=resource.RUSAGE_SELF):
+    """Peak resident set size in MB (ru_maxrss is KB on Linux, bytes on macOS)"""
+    peak = resource.getrusage(who).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_case(prop_path, comps_path, loi_rows):
+    """Run every stage once in this process and return timings and row counts"""
+    # app resolves the LOI template and output folders against the cwd, so
+    # import it from a scratch directory holding a copy of the template. The
+    # database lives there too: importing app creates and migrates it.
+    workdir = tempfile.mkdtemp(prefix='dealfinder-bench-')
+    shutil.copy(os.path.join(REPO_DIR, 'Offer_Sheet_Template.docx'), workdir)
+    os.chdir(workdir)
+    os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    sys.path.insert(0, REPO_DIR)
+
+    import app as dealfinder
+
+    timings = dict.fromkeys(STAGES, 0.0)
+    rows = dict.fromkeys(STAGES, 0)
+
+    try:
+        with dealfinder.app.app_context():
+            start = time.perf_counter()
+            comps_df = dealfinder.read_comps(comps_path)
+            timings['read_comps'] = time.perf_counter() - start
+            rows['read_comps'] = len(comps_df)
+
+            start = time.perf_counter()
+            comps_index = dealfinder.build_comps_index(comps_df)
+            timings['calculate_arv'] = time.perf_counter() - start
+            rows['calculate_arv'] = len(comps_df)
+            del comps_df
+
+            mapping = dealfinder.column_mapping(dealfinder.read_header(prop_path), 'properties')
+            sqft_col = mapping['sqft']
+            location_cols = (mapping['zip'], mapping['latitude'], mapping['longitude'])
+
+            engine = dealfinder.db.engine
+            loi_input = []
+
+            chunks = dealfinder.read_file_chunks(prop_path, dealfinder.app.config['INGEST_CHUNK_ROWS'],
+                                                 usecols=mapping.usecols, text_columns=mapping.text_columns)
+            while True:
+                start = time.perf_counter()
+                chunk = next(chunks, None)
+                timings['read_properties'] += time.perf_counter() - start
+                if chunk is None:
+                    break
+                rows['read_properties'] += len(chunk)
+
+                start = time.perf_counter()
+                scored, _ = dealfinder.score_properties(chunk, sqft_col, comps_index, location_cols)
+                timings['score'] += time.perf_counter() - start
+                rows['score'] += len(scored)
+
+                for row in scored:
+                    row.update(session_id='bench', loi_file=None, loi_sent=False, follow_up_sent=False)
+                start = time.perf_counter()
+                with engine.begin() as connection:
+                    dealfinder.insert_properties(connection, scored)
+                timings['db_commit'] += time.perf_counter() - start
+                rows['db_commit'] += len(scored)
+
+                wanted = loi_rows - len(loi_input)
+                loi_input.extend({'Address': row['address'], 'Offer Price': row['offer_price']}
+                                 for row in scored[:max(wanted, 0)])
+
+            start = time.perf_counter()
+            dealfinder.generate_lois(loi_input, 'Bench Capital', 'Bench User', 'bench@example.com')
+            timings['generate_loi'] = time.perf_counter() - start
+            rows['generate_loi'] = len(loi_input)
+            engine.dispose()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return {
+        'stages': {stage: {
+            'seconds': round(timings[stage], 4),
+            'rows': rows[stage],
+            'rows_per_sec': round(rows[stage] / timings[stage], 1) if timings[stage] > 0 else None
+        } for stage in STAGES},
+        'total_seconds': round(sum(timings.values()), 4),
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+        'peak_rss_children_mb': round(peak_rss_mb(resource.RUSAGE_CHILDREN), 1)
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000, 10000, 100000, 1000000])
+    parser.add_argument('--formats', nargs='+', choices=['csv', 'xlsx'], default=['csv'])
+    parser.add_argument('--variant', type=int, default=0, help='header spelling variant (0-4)')
+    parser.add_argument('--loi-rows', type=int, default=500, help='LOIs rendered per case')
+    parser.add_argument('--data-dir', default=os.path.join(BENCH_DIR, 'data'))
+    parser.add_argument('--output', help='write results as JSON to this file')
+    parser.add_argument('--run-case', nargs=2, metavar=('PROPERTIES', 'COMPS'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_case:
+        # Child mode: one case, JSON on stdout
+        print(json.dumps(run_case(*args.run_case, args.loi_rows)))
+        return
+
+    cases = []
+    for n_rows in args.rows:
+        for fmt in args.formats:
+            prop_path, comps_path = dataset_paths(args.data_dir, n_rows, fmt, args.variant)
+            completed = subprocess.run([sys.executable, os.path.abspath(__file__), '--run-case', prop_path, comps_path,
+                                        '--loi-rows', str(args.loi_rows)],
+                                       capture_output=True, text=True, check=True)
+            case = json.loads(completed.stdout.strip().splitlines()[-1])
+            case.update(rows=n_rows, format=fmt, properties_file=os.path.basename(prop_path),
+                        comps_file=os.path.basename(comps_path))
+            cases.append(case)
+
+            print(f"{n_rows:>9,} rows {fmt:<4}  total {case['total_seconds']:8.2f}s  "
+                  f"peak RSS {case['peak_rss_mb']:8.1f} MB")
+            for stage in STAGES:
+                result = case['stages'][stage]
+                rate = f"{result['rows_per_sec']:12,.0f} rows/s" if result['rows_per_sec'] else ''
+                print(f"    {stage:<16} {result['seconds']:8.3f}s  {rate}")
+
+    report = {
+        'benchmark': 'upload_pipeline',
+        'revision': git_revision(),
+        'timestamp': datetime.utcnow().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'loi_rows': args.loi_rows,
+        'cases': cases
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"results written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
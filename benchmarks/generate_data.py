@@ -0,0 +1,164 @@
+"""Generate synthetic property and comps files shaped like real MLS / county exports.
+
+Prices and square footage come in a mix of "$1,234,000", "1,234,000", plain
+numbers and blanks, and each header variant uses a different spelling of the
+price and square footage columns so the PRICE_PATTERNS / SQFT_PATTERNS
+fallbacks get exercised.
+
+Usage: python benchmarks/generate_data.py [--rows 1000 10000] [--formats csv xlsx] [--out DIR]
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+
+# (sqft header, comps price header) pairs; each one matches a different pattern
+HEADER_VARIANTS = [
+    ('Living Square Feet', 'Last Sale Amount'),
+    ('Living Area', 'Sale Amount'),
+    ('Bldg Sq Ft', 'Sold Price'),
+    ('SqFt', 'Sale Price'),
+    ('Building Square Feet', 'Price'),
+]
+
+# City centres the synthetic listings cluster around: (city, state, zip prefix, lat, lon)
+MARKETS = [
+    ('Austin', 'TX', '787', 30.27, -97.74),
+    ('Dallas', 'TX', '752', 32.78, -96.80),
+    ('Phoenix', 'AZ', '850', 33.45, -112.07),
+    ('Atlanta', 'GA', '303', 33.75, -84.39),
+    ('Columbus', 'OH', '432', 39.96, -83.00),
+]
+
+STREETS = ['Main St', 'Oak Ave', 'Maple Dr', 'Cedar Ln', 'Elm St', 'Pine Rd', 'Lakeview Blvd', 'Hill Ct']
+CONDITIONS = ['', '', '', 'Good', 'fair', 'POOR', 'excellent', 'average', 'n/a']
+FIRST_NAMES = ['Ann', 'Bob', 'Carla', 'Dev', 'Eli', 'Fran']
+LAST_NAMES = ['Lee', 'Patel', 'Garcia', 'Nguyen', 'Smith', 'Okafor']
+
+
+def messy_numbers(values, rng, currency):
+    """Format numbers the way exports do: "$1,234", "1,234", "1234" or blank"""
+    style = rng.random(len(values))
+    text = np.empty(len(values), dtype=object)
+    rounded = np.round(values).astype(np.int64)
+    for i, (value, roll) in enumerate(zip(rounded, style)):
+        if roll < 0.03:
+            text[i] = ''
+        elif roll < 0.04:
+            text[i] = 'N/A'
+        elif roll < 0.55:
+            text[i] = f"${value:,}" if currency else f"{value:,}"
+        else:
+            text[i] = str(value)
+    return text
+
+
+def locations(n_rows, rng):
+    """Market, zip, latitude and longitude for n_rows homes spread around the markets"""
+    market = rng.integers(0, len(MARKETS), n_rows)
+    lat0 = np.array([m[3] for m in MARKETS])[market]
+    lon0 = np.array([m[4] for m in MARKETS])[market]
+    lat = lat0 + rng.normal(0, 0.08, n_rows)
+    lon = lon0 + rng.normal(0, 0.08, n_rows)
+    # Zips follow a coarse grid inside each market so neighbours usually share one
+    zip_suffix = (np.floor((lat - lat0) * 20) * 7 + np.floor((lon - lon0) * 20)).astype(np.int64) % 100
+    zips = np.array([f"{MARKETS[m][2]}{s:02d}" for m, s in zip(market, zip_suffix)])
+    return market, zips, lat, lon
+
+
+def generate_properties(n_rows, seed=0, variant=0):
+    """Property list with listing prices, square footage, condition overrides and agents"""
+    rng = np.random.default_rng(seed)
+    sqft_header = HEADER_VARIANTS[variant % len(HEADER_VARIANTS)][0]
+    market, zips, lat, lon = locations(n_rows, rng)
+    sqft = rng.lognormal(np.log(1700), 0.35, n_rows).clip(400, 9000)
+    listing_price = sqft * rng.normal(220, 45, n_rows).clip(60, 600)
+    first = rng.integers(0, len(FIRST_NAMES), n_rows)
+    last = rng.integers(0, len(LAST_NAMES), n_rows)
+
+    return pd.DataFrame({
+        'Address': [f"{i + 100} {STREETS[i % len(STREETS)]}" for i in range(n_rows)],
+        'City': [MARKETS[m][0] for m in market],
+        'State': [MARKETS[m][1] for m in market],
+        'Zip': zips,
+        'Latitude': lat.round(6),
+        'Longitude': lon.round(6),
+        'Listing Price': messy_numbers(listing_price, rng, currency=True),
+        sqft_header: messy_numbers(sqft, rng, currency=False),
+        'Condition Override': rng.choice(CONDITIONS, n_rows),
+        'Listing Agent First Name': [FIRST_NAMES[i] for i in first],
+        'Listing Agent Last Name': [LAST_NAMES[i] for i in last],
+        'Listing Agent Email': [f"{FIRST_NAMES[a].lower()}.{LAST_NAMES[b].lower()}@example.com"
+                                for a, b in zip(first, last)],
+        'Listing Agent Phone': [f"555-{i % 10000:04d}" for i in range(n_rows)],
+    })
+
+
+def generate_comps(n_rows, seed=1, variant=0):
+    """Recent sales with sale price, square footage, location and sale date"""
+    rng = np.random.default_rng(seed)
+    sqft_header, price_header = HEADER_VARIANTS[variant % len(HEADER_VARIANTS)]
+    _, zips, lat, lon = locations(n_rows, rng)
+    sqft = rng.lognormal(np.log(1700), 0.35, n_rows).clip(400, 9000)
+    sale_price = sqft * rng.normal(230, 40, n_rows).clip(60, 600)
+    # A sprinkle of outliers for the IQR filter
+    outliers = rng.random(n_rows) < 0.01
+    sale_price[outliers] *= rng.choice([0.05, 20.0], outliers.sum())
+    sale_dates = pd.Timestamp('2023-01-01') + pd.to_timedelta(rng.integers(0, 730, n_rows), unit='D')
+
+    return pd.DataFrame({
+        'Address': [f"{i + 1} {STREETS[(i * 3) % len(STREETS)]}" for i in range(n_rows)],
+        'Zip': zips,
+        'Latitude': lat.round(6),
+        'Longitude': lon.round(6),
+        price_header: messy_numbers(sale_price, rng, currency=True),
+        sqft_header: messy_numbers(sqft, rng, currency=False),
+        'Last Sale Date': sale_dates.strftime('%Y-%m-%d'),
+    })
+
+
+def write_frame(df, path):
+    """Write a frame as CSV or XLSX (streamed with openpyxl's write-only mode)"""
+    if path.endswith('.csv'):
+        df.to_csv(path, index=False)
+        return
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(list(df.columns))
+    for row in df.itertuples(index=False):
+        sheet.append([value.item() if isinstance(value, np.generic) else value for value in row])
+    workbook.save(path)
+
+
+def dataset_paths(out_dir, n_rows, fmt, variant=0, comps_ratio=0.5):
+    """Generate (or reuse) a property/comps file pair and return their paths"""
+    os.makedirs(out_dir, exist_ok=True)
+    n_comps = max(int(n_rows * comps_ratio), 100)
+    prop_path = os.path.join(out_dir, f"properties_{n_rows}_v{variant}.{fmt}")
+    comps_path = os.path.join(out_dir, f"comps_{n_comps}_v{variant}.{fmt}")
+    if not os.path.exists(prop_path):
+        write_frame(generate_properties(n_rows, seed=n_rows, variant=variant), prop_path)
+    if not os.path.exists(comps_path):
+        write_frame(generate_comps(n_comps, seed=n_comps + 1, variant=variant), comps_path)
+    return prop_path, comps_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000, 10000, 100000, 1000000])
+    parser.add_argument('--formats', nargs='+', choices=['csv', 'xlsx'], default=['csv', 'xlsx'])
+    parser.add_argument('--variant', type=int, default=0, help='header spelling variant (0-4)')
+    parser.add_argument('--comps-ratio', type=float, default=0.5, help='comps rows per property row')
+    parser.add_argument('--out', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data'))
+    args = parser.parse_args()
+
+    for n_rows in args.rows:
+        for fmt in args.formats:
+            for path in dataset_paths(args.out, n_rows, fmt, args.variant, args.comps_ratio):
+                print(f"{path}  {os.path.getsize(path) / 1e6:8.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
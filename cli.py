@@ -0,0 +1,266 @@
+"""Score property files against a comps file without the web app.
+
+Runs the /upload pipeline (column mapping, local ARV pricing, optional LOI
+rendering) over many property files at once, one file per worker process.
+Each file's scored rows are streamed chunk by chunk to a CSV or Parquet file,
+and with --save-db also stored in the app's database as a session, just as an
+upload would be. A throughput table is printed at the end.
+
+Usage: python cli.py PROPERTIES [PROPERTIES ...] --comps COMPS [--out DIR] [--format csv|parquet]
+                     [--workers N] [--save-db] [--lois] [--business-name NAME]
+                     [--user-name NAME] [--user-email EMAIL]
+
+PROPERTIES may be files, directories (every .csv/.xlsx/.xls inside) or globs.
+"""
+import argparse
+import glob
+import logging
+import multiprocessing
+import os
+import sys
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+import app as dealfinder
+from app import app
+
+logger = logging.getLogger(__name__)
+
+# Scored row columns written to the output files (Property field -> header)
+OUTPUT_FIELDS = [(label, field) for label, field in dealfinder.PROPERTY_FIELDS.items()
+                 if label not in ('Id', 'LOI URL', 'LOI Sent', 'Follow-Up Sent')]
+
+# Set in each worker by init_worker so the index is pickled once per process, not per file
+comps_index = None
+
+def property_files(patterns):
+    """Expand files, directories and globs into a sorted list of property files"""
+    paths = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            candidates = [os.path.join(pattern, name) for name in os.listdir(pattern)]
+        else:
+            candidates = glob.glob(pattern)
+        paths.update(path for path in candidates if os.path.isfile(path) and dealfinder.allowed_file(path))
+    return sorted(paths)
+
+def output_path(out_dir, prop_path, fmt):
+    """Output file for a property file; keeps the source extension so x.csv and x.xlsx don't collide"""
+    stem, ext = os.path.splitext(os.path.basename(prop_path))
+    return os.path.join(out_dir, f"{stem}_{ext.lstrip('.').lower()}_scored.{fmt}")
+
+class CsvWriter:
+    """Appends scored chunks to a CSV file, writing the header once"""
+
+    def __init__(self, path):
+        self.file = open(path, 'w', newline='')
+        self.header = True
+
+    def write(self, frame):
+        frame.to_csv(self.file, header=self.header, index=False)
+        self.header = False
+
+    def close(self):
+        self.file.close()
+
+class ParquetWriter:
+    """Appends scored chunks to a Parquet file as row groups"""
+
+    def __init__(self, path):
+        self.path = path
+        self.writer = None
+
+    def write(self, frame):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        if self.writer is None:
+            self.writer = pq.ParquetWriter(self.path, table.schema)
+        self.writer.write_table(table.cast(self.writer.schema))
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+WRITERS = {'csv': CsvWriter, 'parquet': ParquetWriter}
+
+def init_worker(index, log_level):
+    global comps_index
+    comps_index = index
+    logging.getLogger().setLevel(log_level)
+
+def score_file(prop_path, options, input_hash):
+    """Score one property file, write its output and optionally store it as a session.
+
+    Runs in a worker process and returns a summary dict for the report.
+    """
+    started = time.perf_counter()
+    header = dealfinder.read_header(prop_path)
+    mapping = dealfinder.column_mapping(header, 'properties')
+    sqft_col = mapping['sqft']
+    if not sqft_col:
+        raise ValueError(f'Living square feet column not found. Available columns: {header}')
+    location_cols = (mapping['zip'], mapping['latitude'], mapping['longitude'])
+
+    session_id = None
+    store = False
+    if options.save_db:
+        with app.app_context():
+            existing = dealfinder.Session.query.filter_by(input_hash=input_hash).first()
+        if existing:
+            logger.info(f"{prop_path} is already stored as session {existing.session_id}")
+            session_id = existing.session_id
+        else:
+            session_id = str(uuid.uuid4())
+            store = True
+
+    out_path = output_path(options.out, prop_path, options.format)
+    writer = WRITERS[options.format](out_path)
+    total_properties = 0
+    high_potential_count = 0
+    lois_generated = 0
+    try:
+        for chunk in dealfinder.read_file_chunks(prop_path, options.chunk_rows,
+                                                 usecols=mapping.usecols, text_columns=mapping.text_columns):
+            rows, _ = dealfinder.score_properties(chunk, sqft_col, comps_index, location_cols)
+
+            loi_files = [None] * len(rows)
+            if options.lois:
+                rendered = [i for i, row in enumerate(rows) if row['high_potential']]
+                loi_rows = [{'Address': rows[i]['address'], 'Offer Price': rows[i]['offer_price']} for i in rendered]
+                results, _ = dealfinder.generate_loi_batch(loi_rows, options.business_name, options.user_name,
+                                                           options.user_email)
+                for i, loi_file in zip(rendered, results):
+                    loi_files[i] = loi_file
+
+            for row, loi_file in zip(rows, loi_files):
+                row.update(loi_file=loi_file, loi_sent=False, follow_up_sent=False)
+
+            frame = pd.DataFrame.from_records(rows, columns=[field for _, field in OUTPUT_FIELDS])
+            frame.columns = [label for label, _ in OUTPUT_FIELDS]
+            writer.write(frame)
+
+            if store:
+                for row in rows:
+                    row['session_id'] = session_id
+                with app.app_context():
+                    dealfinder.save_properties(rows)
+
+            total_properties += len(rows)
+            high_potential_count += sum(row['high_potential'] for row in rows)
+            lois_generated += sum(dealfinder.is_rendered_loi(loi_file) for loi_file in loi_files)
+    finally:
+        writer.close()
+
+    if store:
+        with app.app_context():
+            dealfinder.save_session(dealfinder.Session(
+                session_id=session_id,
+                business_name=options.business_name,
+                user_name=options.user_name,
+                user_email=options.user_email,
+                total_properties=total_properties,
+                high_potential_count=high_potential_count,
+                avg_price_per_sqft=comps_index.global_price_per_sqft,
+                comps_used=comps_index.global_count,
+                lois_generated=lois_generated,
+                follow_ups_sent=0,
+                input_hash=input_hash
+            ))
+
+    return {
+        'file': prop_path,
+        'output': out_path,
+        'rows': total_properties,
+        'high_potential': high_potential_count,
+        'lois': lois_generated,
+        'session_id': session_id,
+        'seconds': time.perf_counter() - started
+    }
+
+def print_report(summaries, failures, wall_seconds):
+    print(f"{'file':<40} {'rows':>10} {'seconds':>9} {'rows/s':>10} {'high pot.':>9}  session")
+    for summary in summaries:
+        rate = summary['rows'] / summary['seconds'] if summary['seconds'] > 0 else 0
+        print(f"{os.path.basename(summary['file']):<40} {summary['rows']:>10,} {summary['seconds']:>9.2f} "
+              f"{rate:>10,.0f} {summary['high_potential']:>9,}  {summary['session_id'] or '-'}")
+    for prop_path, error in failures:
+        print(f"{os.path.basename(prop_path):<40} FAILED: {error}")
+
+    total_rows = sum(summary['rows'] for summary in summaries)
+    rate = total_rows / wall_seconds if wall_seconds > 0 else 0
+    print(f"{len(summaries)} files, {total_rows:,} rows in {wall_seconds:.2f}s ({rate:,.0f} rows/s overall)")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('properties', nargs='+', help='property files, directories or globs')
+    parser.add_argument('--comps', required=True, help='comps file every property file is priced against')
+    parser.add_argument('--out', default='scored', help='directory for the scored output files')
+    parser.add_argument('--format', choices=sorted(WRITERS), default='csv')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--chunk-rows', type=int, default=app.config['INGEST_CHUNK_ROWS'])
+    parser.add_argument('--save-db', action='store_true', help='also store each file as a session in the database')
+    parser.add_argument('--lois', action='store_true', help='render LOIs for high-potential properties')
+    parser.add_argument('--business-name', default='')
+    parser.add_argument('--user-name', default='')
+    parser.add_argument('--user-email', default='')
+    parser.add_argument('--verbose', action='store_true')
+    args = parser.parse_args()
+
+    log_level = logging.INFO if args.verbose else logging.WARNING
+    logging.getLogger().setLevel(log_level)
+
+    paths = property_files(args.properties)
+    if not paths:
+        parser.error('no property files matched')
+    outputs = {}
+    for path in paths:
+        out_path = output_path(args.out, path, args.format)
+        if out_path in outputs:
+            parser.error(f'{outputs[out_path]} and {path} would both be written to {out_path}')
+        outputs[out_path] = path
+    if args.format == 'parquet':
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            parser.error('Parquet output needs pyarrow (pip install pyarrow)')
+    os.makedirs(args.out, exist_ok=True)
+
+    started = time.perf_counter()
+    comps_df = dealfinder.read_comps(args.comps)
+    if comps_df.empty:
+        parser.error(f'no usable comps in {args.comps}')
+    with app.app_context():
+        index = dealfinder.build_comps_index(comps_df)
+        if args.save_db:
+            dealfinder.save_comps(comps_df)
+        # Same hash as an upload of these files, so the web app dedups against CLI sessions
+        input_hashes = {path: dealfinder.upload_input_hash(path, args.comps, args.business_name, args.user_name,
+                                                           args.user_email) for path in paths}
+    del comps_df
+    if index.global_price_per_sqft == 0:
+        parser.error(f'unable to calculate ARV from {args.comps}')
+
+    summaries = []
+    failures = []
+    # spawn, like the app's LOI pool, so workers start from a clean interpreter
+    with ProcessPoolExecutor(max_workers=min(args.workers, len(paths)), mp_context=multiprocessing.get_context('spawn'),
+                             initializer=init_worker, initargs=(index, log_level)) as pool:
+        futures = {pool.submit(score_file, path, args, input_hashes[path]): path for path in paths}
+        for future in as_completed(futures):
+            try:
+                summaries.append(future.result())
+            except Exception as e:
+                logger.error(f"Scoring {futures[future]} failed: {str(e)}")
+                failures.append((futures[future], str(e)))
+
+    summaries.sort(key=lambda summary: summary['file'])
+    print_report(summaries, failures, time.perf_counter() - started)
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
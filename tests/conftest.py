@@ -0,0 +1,47 @@
+"""Shared fixtures.
+
+app resolves the LOI template and its output folders against the cwd and
+creates its database on import, so it is imported once per test run from a
+scratch directory holding a copy of the template and a throwaway SQLite file.
+"""
+import os
+import shutil
+import sys
+import tempfile
+import uuid
+
+import pytest
+
+REPO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+WORK_DIR = tempfile.mkdtemp(prefix='dealfinder-tests-')
+
+shutil.copy(os.path.join(REPO_DIR, 'Offer_Sheet_Template.docx'), WORK_DIR)
+os.chdir(WORK_DIR)
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(WORK_DIR, 'tests.db')}"
+sys.path.insert(0, REPO_DIR)
+
+import app as dealfinder  # noqa: E402
+
+
+@pytest.fixture(scope='session')
+def app_module():
+    return dealfinder
+
+
+@pytest.fixture
+def client():
+    return dealfinder.app.test_client()
+
+
+@pytest.fixture
+def make_session(app_module):
+    """Store a session with the given Property column values; returns its session_id"""
+    def make(properties):
+        session_id = str(uuid.uuid4())
+        with app_module.app.app_context():
+            app_module.save_session(app_module.Session(
+                session_id=session_id, business_name='Acme Homes', user_name='Pat Doe',
+                user_email='pat@example.com', total_properties=len(properties)))
+            app_module.save_properties([{'session_id': session_id, **values} for values in properties])
+        return session_id
+    return make
@@ -0,0 +1,54 @@
+"""The whole-column cleaners must agree with the per-cell helpers they replace."""
+import numpy as np
+import pandas as pd
+import pytest
+
+NUMERIC_CASES = [
+    pd.Series(['$200,000', '1,500', '12.5%', ' 42 ', '', None, np.nan, 'N/A', '$', '1e3', '-7', 'abc123']),
+    pd.Series(['100', '200.5', '3e2']),
+    pd.Series([1, 2, 3]),
+    pd.Series([1.5, np.nan, -2.0]),
+    pd.Series([True, False, True]),
+    pd.Series([200000.5, 'N/A', 150000, None, '$175,000', True], dtype=object),
+    pd.Series([], dtype=object),
+]
+
+BOOLEAN_CASES = [
+    pd.Series(['Yes', ' no ', 'TRUE', 'f', '1', '0', 'on', 'OFF', 'maybe', '', None, np.nan]),
+    pd.Series([True, False, True]),
+    pd.Series([1, 0, 2]),
+    pd.Series([1.0, 0.0, np.nan]),
+    pd.Series([True, 'y', None, 1], dtype=object),
+    pd.Series([], dtype=object),
+]
+
+CONDITION_CASES = [
+    pd.Series(['Excellent', ' good ', 'FAIR', 'poor', 'average', 'High', 'low', 'medium', 'rough', '', None, np.nan]),
+    pd.Series([1, 2, 3]),
+    pd.Series(['Good', None, 5], dtype=object),
+    pd.Series([], dtype=object),
+]
+
+
+@pytest.mark.parametrize('series', NUMERIC_CASES)
+def test_clean_numeric_matches_safe_float(app_module, series):
+    expected = np.array([app_module.safe_float(value) for value in series], dtype=np.float64)
+    np.testing.assert_array_equal(app_module.clean_numeric(series).to_numpy(), expected)
+
+
+@pytest.mark.parametrize('series', BOOLEAN_CASES)
+def test_clean_boolean_matches_normalize_boolean(app_module, series):
+    expected = [app_module.normalize_boolean(value) for value in series]
+    assert app_module.clean_boolean(series).tolist() == expected
+
+
+@pytest.mark.parametrize('series', CONDITION_CASES)
+def test_clean_condition_matches_normalize_condition(app_module, series):
+    expected = [app_module.normalize_condition(value) for value in series]
+    assert app_module.clean_condition(series).tolist() == expected
+
+
+def test_cleaners_keep_the_index(app_module):
+    series = pd.Series(['$1', 'yes', 'good'], index=[10, 20, 30])
+    for clean in (app_module.clean_numeric, app_module.clean_boolean, app_module.clean_condition):
+        assert clean(series).index.tolist() == [10, 20, 30]
@@ -0,0 +1,46 @@
+"""The .xlsx columnar cache must hand back the same DataFrames as parsing the workbook."""
+from datetime import datetime
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+ROWS = [
+    ['Address', 'Listing Price', 'Living Square Feet', 'Zip', 'Vacant', 'Sale Date'],
+    ['1 Main St', 200000.5, 1500, '02134', True, datetime(2023, 1, 5)],
+    ['2 Main St', 'N/A', None, 2134, False, datetime(2023, 2, 6)],
+    ['3 Main St', 150000, 1800, '02135', None, None],
+    [None, None, 2100, 2135, 'yes', datetime(2023, 3, 7)],
+    ['5 Main St', '$175,000', 1650, '02136', False, datetime(2023, 4, 8)],
+]
+
+
+@pytest.fixture
+def mixed_workbook(tmp_path):
+    workbook = Workbook()
+    for row in ROWS:
+        workbook.active.append(row)
+    path = str(tmp_path / 'mixed.xlsx')
+    workbook.save(path)
+    return path
+
+
+@pytest.mark.parametrize('text_columns', [(), ('Listing Price', 'Zip')])
+def test_cached_read_matches_fresh_parse(app_module, mixed_workbook, text_columns):
+    fresh = list(app_module.read_xlsx_chunks(mixed_workbook, 2, text_columns=text_columns))
+    cache_dir = app_module.columnar_dir(mixed_workbook)
+    meta = app_module.load_columnar_meta(cache_dir)
+    assert meta is not None
+
+    cached = list(app_module.read_columnar_chunks(cache_dir, meta, meta['header'], 2, text_columns))
+    assert len(cached) == len(fresh) == 3
+    for fresh_chunk, cached_chunk in zip(fresh, cached):
+        pd.testing.assert_frame_equal(cached_chunk.reset_index(drop=True), fresh_chunk.reset_index(drop=True))
+
+
+def test_mixed_column_keeps_cell_types(app_module, mixed_workbook):
+    list(app_module.read_xlsx_chunks(mixed_workbook, 10))
+    cached = pd.concat(app_module.read_xlsx_chunks(mixed_workbook, 10))
+
+    assert cached['Listing Price'].tolist()[:3] == [200000.5, 'N/A', 150000]
+    assert cached['Zip'].tolist()[:2] == ['02134', 2134]
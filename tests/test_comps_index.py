@@ -0,0 +1,75 @@
+"""CompsIndex's grid search must price properties exactly like a brute-force kNN."""
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def brute_force_price(app_module, comps, properties, neighbors, min_comps, radius):
+    """Price each property from its k nearest comps in range, else its zip, else all comps"""
+    comp_x, comp_y = app_module.project_miles(comps['lat'].to_numpy(), comps['lon'].to_numpy())
+    prop_x, prop_y = app_module.project_miles(properties['lat'].to_numpy(), properties['lon'].to_numpy())
+    all_comps = app_module.remove_outliers(comps['ppsf'])
+
+    zip_means = {}
+    for zip_code, group in comps.groupby('zip'):
+        filtered = app_module.remove_outliers(group['ppsf'])
+        if len(filtered) >= min_comps:
+            zip_means[zip_code] = (filtered.mean(), len(filtered))
+
+    prices, counts = [], []
+    for i in range(len(properties)):
+        dist = np.hypot(comp_x - prop_x[i], comp_y - prop_y[i])
+        nearest = np.argsort(dist)[:neighbors]
+        in_range = nearest[dist[nearest] <= radius]
+        local = app_module.remove_outliers(comps['ppsf'].iloc[in_range].reset_index(drop=True))
+        if len(local) >= min_comps:
+            prices.append(local.mean())
+            counts.append(len(local))
+        elif properties['zip'][i] in zip_means:
+            prices.append(zip_means[properties['zip'][i]][0])
+            counts.append(zip_means[properties['zip'][i]][1])
+        else:
+            prices.append(all_comps.mean())
+            counts.append(len(all_comps))
+    return np.array(prices), np.array(counts)
+
+
+@pytest.fixture
+def market():
+    rng = np.random.default_rng(7)
+    comps = pd.DataFrame({
+        'lat': 42.30 + rng.random(600) * 0.12,
+        'lon': -71.15 + rng.random(600) * 0.15,
+        'ppsf': rng.lognormal(5.4, 0.35, 600),
+        'zip': rng.choice(['02134', '02135', '02136', '02137'], 600),
+    })
+    properties = pd.DataFrame({
+        # Some well outside the comps' area, so the zip and global fallbacks are exercised
+        'lat': 42.28 + rng.random(300) * 0.2,
+        'lon': -71.18 + rng.random(300) * 0.25,
+        'zip': rng.choice(['02134', '02135', '02199'], 300),
+    })
+    return comps, properties
+
+
+@pytest.mark.parametrize('neighbors,min_comps,radius', [(10, 3, 1.0), (5, 3, 0.25), (25, 5, 2.0)])
+def test_grid_search_matches_brute_force(app_module, market, neighbors, min_comps, radius):
+    comps, properties = market
+    index = app_module.CompsIndex(comps['ppsf'], comps['zip'], comps['lat'], comps['lon'],
+                                  neighbors=neighbors, min_comps=min_comps, radius_miles=radius)
+    # A small batch_cells splits cells into several distance-matrix batches
+    ppsf, counts = index.price(len(properties), properties['zip'], properties['lat'], properties['lon'],
+                               batch_cells=1000)
+
+    expected_ppsf, expected_counts = brute_force_price(app_module, comps, properties, neighbors, min_comps, radius)
+    np.testing.assert_allclose(ppsf, expected_ppsf, rtol=1e-12)
+    np.testing.assert_array_equal(counts, expected_counts)
+
+
+def test_properties_without_coordinates_use_zip_then_global(app_module, market):
+    comps, _ = market
+    index = app_module.CompsIndex(comps['ppsf'], comps['zip'], comps['lat'], comps['lon'])
+    ppsf, _ = index.price(2, zips=['02134', '99999'], lats=[np.nan, np.nan], lons=[np.nan, np.nan])
+
+    assert ppsf[0] == pytest.approx(index.zip_price_per_sqft['02134'])
+    assert ppsf[1] == pytest.approx(index.global_price_per_sqft)
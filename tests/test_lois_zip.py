@@ -0,0 +1,78 @@
+"""The /download_lois ZIP stream and its Range resume."""
+import io
+import uuid
+import zipfile
+
+import pytest
+
+
+@pytest.fixture
+def lois_session(make_session):
+    # A fresh street per test, so its LOIs are not already rendered by another test
+    street = uuid.uuid4().hex[:8]
+    return make_session([{'address': f"{i} {street} Ave", 'offer_price': 100000.0 + i * 2500} for i in range(1, 5)])
+
+
+def download(client, session_id, headers=None):
+    response = client.get('/download_lois', query_string={'session_id': session_id}, headers=headers or {})
+    data = response.data
+    response.close()
+    return response, data
+
+
+def test_archive_holds_every_loi(client, lois_session):
+    response, data = download(client, lois_session)
+
+    assert response.status_code == 200
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        assert archive.testzip() is None
+        names = archive.namelist()
+    assert len(names) == 4
+    assert all(name.endswith('_LOI.docx') for name in names)
+
+
+def test_range_resumes_the_same_archive(client, lois_session):
+    _, full = download(client, lois_session)
+    # Once rendered, the archive's length is known and the bytes are the same
+    second, again = download(client, lois_session)
+    assert again == full
+    assert second.headers['Content-Length'] == str(len(full))
+    etag = second.headers['ETag']
+
+    cut = len(full) // 3
+    partial, rest = download(client, lois_session, {'Range': f'bytes={cut}-', 'If-Range': etag})
+    assert partial.status_code == 206
+    assert partial.headers['Content-Range'] == f'bytes {cut}-{len(full) - 1}/{len(full)}'
+    assert partial.headers['Content-Length'] == str(len(rest))
+    assert full[:cut] + rest == full
+
+    middle, chunk = download(client, lois_session, {'Range': 'bytes=10-99'})
+    assert middle.status_code == 206
+    assert chunk == full[10:100]
+
+
+def test_range_renders_missing_lois_first(client, lois_session):
+    partial, head = download(client, lois_session, {'Range': 'bytes=0-99'})
+    _, full = download(client, lois_session)
+
+    assert partial.status_code == 206
+    assert partial.headers['Content-Range'] == f'bytes 0-99/{len(full)}'
+    assert head == full[:100]
+
+
+def test_stale_if_range_sends_the_whole_archive(client, lois_session):
+    _, full = download(client, lois_session)
+
+    response, data = download(client, lois_session, {'Range': 'bytes=100-', 'If-Range': '"not-this-archive"'})
+
+    assert response.status_code == 200
+    assert data == full
+
+
+def test_unsatisfiable_range(client, lois_session):
+    _, full = download(client, lois_session)
+
+    response, _ = download(client, lois_session, {'Range': f'bytes={len(full) + 10}-'})
+
+    assert response.status_code == 416
+    assert response.headers['Content-Range'] == f'bytes */{len(full)}'
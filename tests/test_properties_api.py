@@ -0,0 +1,75 @@
+"""Keyset pagination of /api/properties."""
+import gzip
+import json
+
+import pytest
+
+PROPERTIES = [
+    {'address': f"{i} Elm St", 'zip_code': f"0213{i % 4}", 'listing_price': None if i % 7 == 0 else float(i % 5 * 1000),
+     'high_potential': i % 3 == 0}
+    for i in range(1, 38)
+]
+
+
+def fetch_all(client, session_id, limit, **params):
+    """Follow next_cursor from the first page to the last; returns the rows and the page count"""
+    rows, pages, cursor = [], 0, None
+    while True:
+        query = {'session_id': session_id, 'limit': limit, 'fields': 'Id,Listing Price', **params}
+        if cursor:
+            query['cursor'] = cursor
+        response = client.get('/api/properties', query_string=query)
+        assert response.status_code == 200
+        page = response.get_json()
+        assert len(page['data']) <= limit
+        rows.extend(page['data'])
+        pages += 1
+        cursor = page['next_cursor']
+        if cursor is None:
+            return rows, pages
+
+
+@pytest.mark.parametrize('sort', ['id', '-id', 'listing_price', '-Listing Price'])
+@pytest.mark.parametrize('limit', [1, 5, 37, 100])
+def test_pages_cover_every_row_once_in_order(client, make_session, sort, limit):
+    session_id = make_session(PROPERTIES)
+
+    rows, pages = fetch_all(client, session_id, limit, sort=sort)
+
+    assert pages == max(1, -(-len(PROPERTIES) // limit))
+    ids = [row['Id'] for row in rows]
+    assert len(ids) == len(set(ids)) == len(PROPERTIES)
+
+    descending = sort.startswith('-')
+    key = 'Id' if sort.lstrip('-') == 'id' else 'Listing Price'
+    # Missing values sort last either way; ties are broken by id in the sort direction
+    present = [row for row in rows if row[key] is not None]
+    assert rows[len(present):] == [row for row in rows if row[key] is None]
+    assert present == sorted(present, key=lambda row: (row[key], row['Id']), reverse=descending)
+
+
+def test_pages_respect_filters(client, make_session):
+    session_id = make_session(PROPERTIES)
+
+    rows, _ = fetch_all(client, session_id, 4, high_potential='true')
+
+    assert len(rows) == sum(values['high_potential'] for values in PROPERTIES)
+
+
+def test_gzipped_page_matches_plain_page(client, make_session):
+    session_id = make_session(PROPERTIES)
+    query = {'session_id': session_id, 'limit': 10}
+
+    plain = client.get('/api/properties', query_string=query)
+    zipped = client.get('/api/properties', query_string=query, headers={'Accept-Encoding': 'gzip'})
+
+    assert zipped.headers['Content-Encoding'] == 'gzip'
+    assert json.loads(gzip.decompress(zipped.data)) == plain.get_json()
+
+
+def test_bad_cursor_is_rejected(client, make_session):
+    session_id = make_session(PROPERTIES)
+
+    response = client.get('/api/properties', query_string={'session_id': session_id, 'cursor': 'not-a-cursor'})
+
+    assert response.status_code == 400